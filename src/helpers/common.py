@@ -1,34 +1,55 @@
+import asyncio
+import random
 from urllib.parse import urljoin
 
 import aiohttp
-import requests
+import orjson
 
+# Requests each gather_json_tolerant call keeps in flight
+FETCH_CONCURRENCY = 50
 
-async def fetch_json_tolerant(session, url):
-    """Coroutine to fetch JSON, tolerating incorrect content-type headers."""
+
+async def fetch_json_tolerant(session, url, retries=5):
+    """Coroutine to fetch JSON, tolerating incorrect content-type headers.
+
+    HTTP 429 responses are retried with jittered exponential backoff."""
     try:
-        async with session.get(url) as response:
-            response.raise_for_status()
-            return await response.json(content_type=None)
-    except aiohttp.ClientError as e:
+        for attempt in range(retries):
+            async with session.get(url) as response:
+                if response.status != 429:
+                    response.raise_for_status()
+                    # Parse the raw body: skips the content-type check and a str decode
+                    return orjson.loads(await response.read())
+            # Back off after leaving the block so the connection returns to the pool meanwhile
+            if attempt < retries - 1:
+                await asyncio.sleep(2**attempt + random.random())
+        print(f"\nWarning: Gave up on {url} after {retries} rate-limited attempts.")
+    except (aiohttp.ClientError, TimeoutError, orjson.JSONDecodeError) as e:
         print(f"\nWarning: Failed to fetch {url}. Error: {e}")
-        return None
+    return None
 
 
-def discover_child_links(catalog_url):
-    """Fetches a catalog and returns a dictionary of its child links."""
-    try:
-        response = requests.get(catalog_url)
-        response.raise_for_status()
-        child_links = [
-            link
-            for link in response.json().get("links", [])
-            if link.get("rel") == "child"
-        ]
-        return {
-            link.get("title"): urljoin(catalog_url, link["href"])
-            for link in child_links
-        }
-    except requests.RequestException as e:
-        print(f"FATAL: Could not fetch entry catalog {catalog_url}. Error: {e}")
+async def gather_json_tolerant(session, urls, concurrency=FETCH_CONCURRENCY):
+    """Fetch many JSON documents concurrently, keeping at most `concurrency` in flight.
+
+    Results are returned in the same order as `urls`, with None for failures."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(url):
+        async with semaphore:
+            return await fetch_json_tolerant(session, url)
+
+    return await asyncio.gather(*(_bounded(u) for u in urls))
+
+
+async def discover_child_links(session, catalog_url):
+    """Coroutine to fetch a catalog and return a dictionary of its child links."""
+    catalog = await fetch_json_tolerant(session, catalog_url)
+    if catalog is None:
+        print(f"FATAL: Could not fetch entry catalog {catalog_url}.")
         return {}
+    return {
+        link.get("title"): urljoin(catalog_url, link["href"])
+        for link in catalog.get("links", ())
+        if link.get("rel") == "child"
+    }
@@ -17,20 +17,24 @@ UMBRA_ASSETS = {
     "sidd": ("_SIDD.nitf", "application/vnd.nitf", ["data"]),
     "cphd": ("_CPHD.cphd", "application/octet-stream", ["data"]),
 }
+_UMBRA_ITEM_SUFFIX = ".stac.v2.json"
+
+# Link hrefs with these schemes are already absolute and are kept as-is
+_ABSOLUTE_SCHEMES = frozenset({"http", "https", "s3", "gs"})
 
 # Free-form properties whose shape varies across items and breaks Arrow schema inference
 _DROP_PROPERTIES = ("providers",)
 
 
 def _umbra_assets(item_url: str) -> dict:
-    base, fname = item_url.rsplit("/", 1)
-    stem = (
-        fname[: -len(".stac.v2.json")]
-        if fname.endswith(".stac.v2.json")
-        else fname.rsplit(".", 1)[0]
-    )
+    # Asset hrefs share the item URL minus its extension, so derive that prefix once
+    if item_url.endswith(_UMBRA_ITEM_SUFFIX):
+        prefix = item_url[: -len(_UMBRA_ITEM_SUFFIX)]
+    else:
+        base, fname = item_url.rsplit("/", 1)
+        prefix = f"{base}/{fname.rsplit('.', 1)[0]}"
     return {
-        key: {"href": f"{base}/{stem}{suffix}", "type": mtype, "roles": roles}
+        key: {"href": prefix + suffix, "type": mtype, "roles": roles}
         for key, (suffix, mtype, roles) in UMBRA_ASSETS.items()
     }
 
@@ -59,7 +63,7 @@ def resolve_links(item: dict, item_url: str, provider: str) -> list:
         if not isinstance(link, dict) or "href" not in link:
             continue
         href = link["href"]
-        if not href.startswith(("http://", "https://", "s3://")):
+        if href.partition(":")[0] not in _ABSOLUTE_SCHEMES:
             href = urljoin(item_url, href)
         out.append({"rel": link.get("rel"), "href": href, "type": link.get("type")})
     return out
@@ -69,14 +73,15 @@ def to_stac_item(item: dict, item_url: str, provider: str) -> dict | None:
     """Turn a raw STAC item into a clean, uniform STAC item dict for stac-geoparquet"""
     if not item or not item.get("geometry"):
         return None
-    geom = force_2d(
-        shape(item["geometry"])
-    )  # Umbra geometries carry a Z coord that breaks stac-map
+    geom = shape(item["geometry"])
     out = dict(item)
     out["type"] = "Feature"
     out.setdefault("stac_version", "1.0.0")
     out["id"] = item.get("id")
-    out["geometry"] = mapping(geom)
+    if geom.has_z:
+        # Umbra geometries carry a Z coord that breaks stac-map; 2D ones pass through as-is
+        geom = force_2d(geom)
+        out["geometry"] = mapping(geom)
     out["bbox"] = [
         float(v) for v in geom.bounds
     ]  # 2D bbox, consistent with the 2D geometry
@@ -106,4 +111,10 @@ def densify_item_assets(items: list[dict]) -> list[dict]:
 
 
 def write_stac_geoparquet(items: list[dict], path: str) -> None:
-    to_parquet(parse_stac_items_to_arrow(densify_item_assets(items)), path)
+    # zstd: noticeably smaller than the snappy default, and readable by DuckDB(-WASM)/pyarrow
+    to_parquet(
+        parse_stac_items_to_arrow(densify_item_assets(items)),
+        path,
+        compression="zstd",
+        compression_level=9,
+    )
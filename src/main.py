@@ -1,26 +1,27 @@
 import argparse
 import asyncio
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 from urllib.parse import urljoin
 
 import aiohttp
-import requests
-import s3fs
 
-from src.helpers.common import discover_child_links, fetch_json_tolerant
-
-# from src.helpers.processing import item_to_record, records_to_gdf, write_geoparquet
+from src.helpers.common import (
+    FETCH_CONCURRENCY,
+    discover_child_links,
+    gather_json_tolerant,
+)
 from src.helpers.processing import (
+    UMBRA_HTTPS_BASE,
     to_stac_item,
     write_stac_geoparquet,
-    densify_item_assets,
 )
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 OUTPUT_DIR = os.path.join(BASE_DIR, "parquets")
 
 UMBRA_BUCKET = "umbra-open-data-catalog"
-UMBRA_HTTPS_BASE = "https://umbra-open-data-catalog.s3.us-west-2.amazonaws.com/"
 
 CATALOG_URLS = {
     "capella": "https://capella-open-data.s3.us-west-2.amazonaws.com/stac/capella-open-data-by-product-type/catalog.json",
@@ -29,12 +30,65 @@ CATALOG_URLS = {
 }
 
 
-async def _discover_umbra_items_s3(bucket):
+async def _discover_umbra_items_s3(session, bucket):
     """Discover Umbra STAC items and return canonical public HTTPS URLs (not fs.url(),
-    which can hand back presigned/region-less forms that would poison synthesized assets)."""
-    fs = s3fs.S3FileSystem(anon=True)
-    s3_paths = fs.glob(f"{bucket}/sar-data/**/*.stac.v2.json")
-    return [UMBRA_HTTPS_BASE + p.split(f"{bucket}/", 1)[-1] for p in s3_paths]
+    which can hand back presigned/region-less forms that would poison synthesized assets).
+    `session` is unused: listing goes through s3fs, not HTTP."""
+    # Imported here: s3fs/aiobotocore are only needed for Umbra and are slow to import,
+    # which every spawned worker would otherwise pay when it re-imports this module
+    import s3fs
+
+    # asynchronous=True runs the LIST calls on this event loop instead of blocking it
+    fs = s3fs.S3FileSystem(anon=True, asynchronous=True)
+    s3 = await fs.set_session()
+    keys = []
+    try:
+        # One flat, server-side prefixed listing; keys are filtered as each page arrives
+        paginator = s3.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(Bucket=bucket, Prefix="sar-data/"):
+            keys.extend(
+                obj["Key"]
+                for obj in page.get("Contents", [])
+                if obj["Key"].endswith(".stac.v2.json")
+            )
+    finally:
+        await s3.close()
+    return [UMBRA_HTTPS_BASE + key for key in keys]
+
+
+async def _discover_collection_items(session, collection_urls):
+    """Fetch collections concurrently and return the absolute URLs of their item links."""
+    collections = await gather_json_tolerant(session, collection_urls)
+    item_urls = []
+    for url, collection in zip(collection_urls, collections):
+        if collection is None:
+            print(f"Warning: Could not process collection {url}")
+            continue
+        item_urls.extend(
+            urljoin(url, link["href"])
+            for link in collection.get("links", ())
+            if link.get("rel") == "item"
+        )
+    return item_urls
+
+
+async def _discover_capella_items(session, catalog_url):
+    """Walk the by-product-type catalog's child collections to their items."""
+    child_links = await discover_child_links(session, catalog_url)
+    return await _discover_collection_items(session, list(child_links.values()))
+
+
+async def _discover_iceye_items(session, collection_url):
+    """Return the item URLs of ICEYE's single flat collection."""
+    return await _discover_collection_items(session, [collection_url])
+
+
+# provider -> coroutine(session, CATALOG_URLS[provider]) returning the item URLs
+DISCOVERERS = {
+    "capella": _discover_capella_items,
+    "iceye": _discover_iceye_items,
+    "umbra": _discover_umbra_items_s3,
+}
 
 
 def _save_items(items, provider):
@@ -50,7 +104,7 @@ def _save_items(items, provider):
         for pt, group in buckets.items():
             path = os.path.join(out_dir, f"capella_{pt}.parquet")
             try:
-                write_stac_geoparquet(densify_item_assets(group), path)
+                write_stac_geoparquet(group, path)
                 print(
                     f"  capella_{pt}: {len(group)} items, {os.path.getsize(path) / 1024 / 1024:.2f} MB"
                 )
@@ -59,7 +113,7 @@ def _save_items(items, provider):
     else:
         path = os.path.join(out_dir, f"{provider}.parquet")
         try:
-            write_stac_geoparquet(densify_item_assets(items), path)
+            write_stac_geoparquet(items, path)
             print(
                 f"\n{provider.upper()}: {len(items)} items, {os.path.getsize(path) / 1024 / 1024:.2f} MB -> {path}"
             )
@@ -67,59 +121,16 @@ def _save_items(items, provider):
             print(f"\n{provider.upper()}: Failed to save - {e}")
 
 
-async def process_provider(provider, session):
-    """Fetch a provider's items and write its parquet(s)."""
-    print(f"\n--- Starting provider: {provider.upper()} ---")
-
-    # Discover item URLs
-    item_urls = []
-    if provider == "umbra":
-        item_urls = await _discover_umbra_items_s3(CATALOG_URLS[provider])
-    elif provider == "capella":
-        for url in discover_child_links(CATALOG_URLS[provider]).values():
-            try:
-                resp = requests.get(url)
-                resp.raise_for_status()
-                links = [
-                    link
-                    for link in resp.json().get("links", [])
-                    if link.get("rel") == "item"
-                ]
-                item_urls.extend(urljoin(url, link["href"]) for link in links)
-            except requests.RequestException:
-                print(f"Warning: Could not process collection {url}")
-    elif provider == "iceye":
-        try:
-            resp = requests.get(CATALOG_URLS[provider])
-            resp.raise_for_status()
-            links = [
-                link
-                for link in resp.json().get("links", [])
-                if link.get("rel") == "item"
-            ]
-            item_urls.extend(link["href"] for link in links)
-        except requests.RequestException:
-            print(f"Warning: Could not process collection {CATALOG_URLS[provider]}")
-
-    if not item_urls:
-        print(f"No items found for {provider}. Skipping.")
-        return
-    print(f"Found {len(item_urls)} items for {provider}.")
-
-    # Fetch all item JSONs once
-    item_jsons = await asyncio.gather(
-        *(fetch_json_tolerant(session, u) for u in item_urls)
-    )
-
-    # Build valid STAC items (assets/links fixed)
+def _build_and_save(fetched, provider):
+    """Build valid STAC items (assets/links fixed) and write them. Runs in a worker process."""
     items = []
-    for url, item in zip(item_urls, item_jsons):
+    for url, item in fetched:
         try:
             stac_item = to_stac_item(item, url, provider)
             if stac_item:
                 items.append(stac_item)
         except Exception as e:
-            print(f"Warning: skipped {(item or {}).get('id')} ({provider}): {e}")
+            print(f"Warning: skipped {item.get('id')} ({provider}): {e}")
 
     if not items:
         print(f"No usable items for {provider}. Skipping.")
@@ -127,14 +138,55 @@ async def process_provider(provider, session):
 
     # Write stac-geoparquet
     _save_items(items, provider)
+
+
+async def process_provider(provider, session, executor):
+    """Fetch a provider's items and write its parquet(s)."""
+    print(f"\n--- Starting provider: {provider.upper()} ---")
+
+    # Discover item URLs
+    item_urls = await DISCOVERERS[provider](session, CATALOG_URLS[provider])
+
+    if not item_urls:
+        print(f"No items found for {provider}. Skipping.")
+        return
+    print(f"Found {len(item_urls)} items for {provider}.")
+
+    # Fetch all item JSONs once; failed fetches (None) and non-object JSON are dropped
+    # before the worker sees them
+    item_jsons = await gather_json_tolerant(session, item_urls)
+    fetched = [(u, j) for u, j in zip(item_urls, item_jsons) if isinstance(j, dict)]
+    if len(fetched) < len(item_jsons):
+        print(f"Warning: {len(item_jsons) - len(fetched)} {provider} items unusable.")
+    del item_jsons
+
+    # Building items and encoding Arrow is CPU-bound; run it off the event loop and the GIL
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(executor, _build_and_save, fetched, provider)
     print(f"--- Finished provider: {provider.upper()} ---")
 
 
 async def main(providers_to_process):
-    async with aiohttp.ClientSession() as session:
-        await asyncio.gather(
-            *(process_provider(p, session) for p in providers_to_process)
+    # spawn, not fork: the parent already runs aiohttp/s3fs threads by the time workers start
+    with ProcessPoolExecutor(
+        max_workers=len(providers_to_process),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        # Pool and reuse connections per bucket host and cache DNS, instead of a connect storm.
+        # Room for every provider's gather at once: waiting for a free slot counts against
+        # the connect timeout, so an undersized pool would drop items under load
+        connector = aiohttp.TCPConnector(
+            limit=len(providers_to_process) * FETCH_CONCURRENCY,
+            limit_per_host=FETCH_CONCURRENCY,
+            ttl_dns_cache=600,
         )
+        timeout = aiohttp.ClientTimeout(total=120, connect=10, sock_read=60)
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout
+        ) as session:
+            await asyncio.gather(
+                *(process_provider(p, session, executor) for p in providers_to_process)
+            )
 
 
 if __name__ == "__main__":
@@ -144,8 +196,13 @@ if __name__ == "__main__":
     parser.add_argument(
         "providers",
         nargs="+",
-        choices=["capella", "iceye", "umbra"],
+        choices=sorted(DISCOVERERS),
         help="A list of providers to process.",
     )
     args = parser.parse_args()
-    asyncio.run(main(args.providers))
+    try:
+        import uvloop
+    except ImportError:  # no Windows builds; the stdlib loop works, just slower
+        asyncio.run(main(args.providers))
+    else:
+        uvloop.run(main(args.providers))
@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import orjson
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# Stable, known-good item URLs for each provider
+SAMPLE_ITEMS = {
+    "capella": "https://capella-open-data.s3.us-west-2.amazonaws.com/stac/capella-open-data-by-datetime/capella-open-data-2025/capella-open-data-2025-08/capella-open-data-2025-08-26/CAPELLA_C13_SP_GEO_HH_20250826023518_20250826023527/CAPELLA_C13_SP_GEO_HH_20250826023518_20250826023527.json",
+    "iceye": "https://iceye-open-data-catalog.s3.amazonaws.com/stac-items/2025/09/ICEYE_ETGCZ1_20250930T115843Z_6360071_X35_SLEDF.json",
+    "umbra": "https://umbra-open-data-catalog.s3.us-west-2.amazonaws.com/sar-data/task-data/0007445c-5da7-4b33-bc0a-facbd249d603/2025-07-15-06-10-12_UMBRA-08/2025-07-15-06-10-12_UMBRA-08.stac.v2.json",
+}
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """One pooled, keep-alive session for every test request (same few S3 hosts throughout).
+
+    requests.Session is not documented as thread-safe, but the only concurrent use is
+    sample_items' three plain GETs to three different hosts: urllib3's connection pools
+    are thread-safe, and nothing mutates the session's cookies, headers or auth."""
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries)
+    with requests.Session() as session:
+        session.mount("https://", adapter)
+        yield session
+
+
+@pytest.fixture(params=list(SAMPLE_ITEMS))
+def sample_provider(request):
+    """Each provider in SAMPLE_ITEMS, so per-provider tests follow that dict."""
+    return request.param
+
+
+def _fetch_sample(session, url):
+    try:
+        resp = session.get(url, timeout=15)
+        resp.raise_for_status()
+        return orjson.loads(resp.content), url
+    except (requests.RequestException, ValueError) as e:
+        return None, str(e)
+
+
+@pytest.fixture(scope="session")
+def sample_items(http_session):
+    """provider -> (item, url), or (None, error) if the fetch failed. Fetched once per run."""
+    # Fetch concurrently so the suite waits on the slowest item, not the sum of all three
+    with ThreadPoolExecutor(max_workers=len(SAMPLE_ITEMS)) as pool:
+        return dict(
+            zip(
+                SAMPLE_ITEMS,
+                pool.map(partial(_fetch_sample, http_session), SAMPLE_ITEMS.values()),
+            )
+        )
@@ -0,0 +1,58 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.helpers import common
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of waiting them out."""
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def _sleep(delay, *args, **kwargs):
+        if delay:  # aiohttp itself yields with sleep(0)
+            delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(common.asyncio, "sleep", _sleep)
+    return delays
+
+
+def _fetch(responses, retries=5):
+    """Serve `responses` (status, body) in order from a local server and fetch it once."""
+    remaining = list(responses)
+
+    async def handler(request):
+        status, body = remaining.pop(0)
+        return web.Response(status=status, body=body)
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/item.json", handler)
+        async with TestServer(app) as server, aiohttp.ClientSession() as session:
+            url = str(server.make_url("/item.json"))
+            return await common.fetch_json_tolerant(session, url, retries=retries)
+
+    return asyncio.run(run())
+
+
+def test_fetch_json_tolerant_retries_429(sleeps):
+    result = _fetch([(429, b""), (429, b""), (200, b'{"id": "a"}')])
+    assert result == {"id": "a"}
+    assert len(sleeps) == 2
+
+
+def test_fetch_json_tolerant_gives_up_on_429(sleeps):
+    assert _fetch([(429, b"")] * 3, retries=3) is None
+    # No pointless wait after the final attempt
+    assert len(sleeps) == 2
+
+
+@pytest.mark.parametrize("body", [b"", b"<Error>not json</Error>"])
+def test_fetch_json_tolerant_bad_body(body):
+    assert _fetch([(200, body)]) is None
@@ -1,5 +1,4 @@
 import pytest
-import requests
 import pyarrow.parquet as pq
 
 from src.helpers.processing import (
@@ -10,34 +9,16 @@ from src.helpers.processing import (
     write_stac_geoparquet,
 )
 
-SAMPLE_ITEMS = {
-    "capella": "https://capella-open-data.s3.us-west-2.amazonaws.com/stac/capella-open-data-by-datetime/capella-open-data-2025/capella-open-data-2025-08/capella-open-data-2025-08-26/CAPELLA_C13_SP_GEO_HH_20250826023518_20250826023527/CAPELLA_C13_SP_GEO_HH_20250826023518_20250826023527.json",
-    "iceye": "https://iceye-open-data-catalog.s3.amazonaws.com/stac-items/2025/09/ICEYE_ETGCZ1_20250930T115843Z_6360071_X35_SLEDF.json",
-    "umbra": "https://umbra-open-data-catalog.s3.us-west-2.amazonaws.com/sar-data/task-data/0007445c-5da7-4b33-bc0a-facbd249d603/2025-07-15-06-10-12_UMBRA-08/2025-07-15-06-10-12_UMBRA-08.stac.v2.json",
-}
-
-
-@pytest.fixture(scope="module")
-def sample_items():
-    items = {}
-    for provider, url in SAMPLE_ITEMS.items():
-        try:
-            resp = requests.get(url, timeout=15)
-            resp.raise_for_status()
-            items[provider] = (resp.json(), url)
-        except requests.RequestException:
-            items[provider] = None
-    return items
-
 
 def _get(sample_items, provider):
-    if not sample_items.get(provider):
-        pytest.skip(f"{provider} sample item unavailable")
-    return sample_items[provider]
+    item, detail = sample_items[provider]
+    if item is None:
+        pytest.skip(f"{provider} sample item unavailable: {detail}")
+    return item, detail
 
 
 def test_to_stac_item_structure(sample_items):
-    for provider in SAMPLE_ITEMS:
+    for provider in sample_items:
         item, url = _get(sample_items, provider)
         rec = to_stac_item(item, url, provider)
         assert rec is not None
@@ -57,7 +38,7 @@ def test_to_stac_item_structure(sample_items):
 
 
 def test_bbox_bounds(sample_items):
-    for provider in SAMPLE_ITEMS:
+    for provider in sample_items:
         item, url = _get(sample_items, provider)
         bbox = to_stac_item(item, url, provider)["bbox"]
         assert isinstance(bbox, (list, tuple))